@@ -140,6 +140,9 @@ class CSVLogger(FlaggingCallback):
     ):
         self.components = components
         self.flagging_dir = flagging_dir
+        # Running count of logged rows, initialized lazily from any existing
+        # log file so each flag() call does not have to re-read the whole CSV
+        self._log_row_count: int | None = None
         os.makedirs(flagging_dir, exist_ok=True)
 
     def flag(
@@ -179,15 +182,20 @@ class CSVLogger(FlaggingCallback):
         csv_data.append(username if username is not None else "")
         csv_data.append(str(datetime.datetime.now()))
 
+        if is_new:
+            self._log_row_count = 0
+        elif self._log_row_count is None:
+            with open(log_filepath, encoding="utf-8") as csvfile:
+                self._log_row_count = len(list(csv.reader(csvfile))) - 1
+
         with open(log_filepath, "a", newline="", encoding="utf-8") as csvfile:
             writer = csv.writer(csvfile)
             if is_new:
                 writer.writerow(utils.sanitize_list_for_csv(headers))
             writer.writerow(utils.sanitize_list_for_csv(csv_data))
 
-        with open(log_filepath, encoding="utf-8") as csvfile:
-            line_count = len(list(csv.reader(csvfile))) - 1
-        return line_count
+        self._log_row_count += 1
+        return self._log_row_count
 
 
 @document()
@@ -4,8 +4,10 @@ Defines helper methods useful for loading and caching Interface examples.
 from __future__ import annotations
 
 import ast
+import asyncio
 import csv
 import inspect
+import itertools
 import os
 import shutil
 import subprocess
@@ -175,20 +177,18 @@ class Examples:
                 "list, where each sublist represents a set of inputs."
             )
 
-        input_has_examples = [False] * len(inputs)
-        for example in examples:
-            for idx, example_for_input in enumerate(example):
-                if example_for_input is not None:
-                    try:
-                        input_has_examples[idx] = True
-                    except IndexError:
-                        pass  # If there are more example components than inputs, ignore. This can sometimes be intentional (e.g. loading from a log file where outputs and timestamps are also logged)
-
-        inputs_with_examples = [
-            inp for (inp, keep) in zip(inputs, input_has_examples) if keep
+        # Columns beyond len(inputs) are ignored. This can sometimes be intentional (e.g. loading from a log file where outputs and timestamps are also logged)
+        input_has_examples = [
+            any(example[idx] is not None for example in examples if idx < len(example))
+            for idx in range(len(inputs))
         ]
+
+        # Compute the columns to keep once and index into each row directly,
+        # instead of re-zipping every row against the keep flags.
+        keep_indices = tuple(idx for idx, keep in enumerate(input_has_examples) if keep)
+        inputs_with_examples = [inputs[idx] for idx in keep_indices]
         non_none_examples = [
-            [ex for (ex, keep) in zip(example, input_has_examples) if keep]
+            [example[idx] for idx in keep_indices if idx < len(example)]
             for example in examples
         ]
 
@@ -205,16 +205,31 @@ class Examples:
         self.api_name = api_name
         self.batch = batch
 
+        # Memoizes component.postprocess(sample) for the duration of this
+        # constructor, so duplicate example values do not re-decode the same
+        # media at launch time. Unhashable samples are processed directly.
+        postprocess_cache: dict[tuple[IOComponent, Any], Any] = {}
+
+        def cached_postprocess(component: IOComponent, sample: Any) -> Any:
+            try:
+                key = (component, sample)
+                if key in postprocess_cache:
+                    return postprocess_cache[key]
+            except TypeError:
+                return component.postprocess(sample)
+            postprocess_cache[key] = component.postprocess(sample)
+            return postprocess_cache[key]
+
         with utils.set_directory(working_directory):
             self.processed_examples = [
                 [
-                    component.postprocess(sample)
+                    cached_postprocess(component, sample)
                     for component, sample in zip(inputs, example)
                 ]
                 for example in examples
             ]
         self.non_none_processed_examples = [
-            [ex for (ex, keep) in zip(example, input_has_examples) if keep]
+            [example[idx] for idx in keep_indices if idx < len(example)]
             for example in self.processed_examples
         ]
         if cache_examples:
@@ -328,27 +343,58 @@ class Examples:
 
             assert self.outputs is not None
             cache_logger.setup(self.outputs, self.cached_folder)
-            for example_id, _ in enumerate(self.examples):
+
+            async def run_prediction(example_id: int):
                 print(f"Caching example {example_id + 1}/{len(self.examples)}")
                 processed_input = self.processed_examples[example_id]
                 if self.batch:
                     processed_input = [[value] for value in processed_input]
+                assert Context.root_block is not None
+                return await Context.root_block.process_api(
+                    fn_index=fn_index,
+                    inputs=processed_input,
+                    request=None,
+                    state={},
+                )
+
+            if inspect.isgeneratorfunction(self.fn) or inspect.isasyncgenfunction(
+                self.fn
+            ):
+                # The generator wrappers above share `generated_values`, so
+                # generator functions must be cached one example at a time.
+                for example_id, _ in enumerate(self.examples):
+                    with utils.MatplotlibBackendMananger():
+                        prediction = await run_prediction(example_id)
+                    output = prediction["data"]
+                    if len(generated_values):
+                        output = merge_generated_values_into_output(
+                            self.outputs, generated_values, output
+                        )
+                    if self.batch:
+                        output = [value[0] for value in output]
+                    cache_logger.flag(output)
+            else:
+                # Regular functions are stateless here, so the examples can
+                # be cached concurrently (bounded so that a large example set
+                # does not launch everything at once) and logged in order.
+                semaphore = asyncio.Semaphore(Context.root_block.max_threads)
+
+                async def run_prediction_with_limit(example_id: int):
+                    async with semaphore:
+                        return await run_prediction(example_id)
+
                 with utils.MatplotlibBackendMananger():
-                    prediction = await Context.root_block.process_api(
-                        fn_index=fn_index,
-                        inputs=processed_input,
-                        request=None,
-                        state={},
-                    )
-                output = prediction["data"]
-                if len(generated_values):
-                    output = merge_generated_values_into_output(
-                        self.outputs, generated_values, output
+                    predictions = await asyncio.gather(
+                        *(
+                            run_prediction_with_limit(example_id)
+                            for example_id, _ in enumerate(self.examples)
+                        )
                     )
-
-                if self.batch:
-                    output = [value[0] for value in output]
-                cache_logger.flag(output)
+                for prediction in predictions:
+                    output = prediction["data"]
+                    if self.batch:
+                        output = [value[0] for value in output]
+                    cache_logger.flag(output)
             # Remove the "fake_event" to prevent bugs in loading interfaces from spaces
             Context.root_block.dependencies.remove(dependency)
             Context.root_block.fns.pop(fn_index)
@@ -384,13 +430,19 @@ class Examples:
             example_id: The id of the example to process (zero-indexed).
         """
         with open(self.cached_file, encoding="utf-8") as cache:
-            examples = list(csv.reader(cache))
-        example = examples[example_id + 1]  # +1 to adjust for header
+            # Stream to the target row instead of materializing the whole
+            # file; +1 to adjust for header
+            example = next(itertools.islice(csv.reader(cache), example_id + 1, None))
         output = []
         assert self.outputs is not None
         for component, value in zip(self.outputs, example):
             value_to_use = value
             try:
+                # Values that need to be parsed are dicts (updates) or lists
+                # (multiple files); anything else (the common case, e.g. a
+                # filename) skips the expensive ast parse entirely.
+                if not value or value[0] not in ("{", "["):
+                    raise ValueError(f"Not a literal: {value}")
                 value_as_dict = ast.literal_eval(value)
                 # File components that output multiple files get saved as a python list
                 # need to pass the parsed list to serialize
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import copy
+import logging
 import time
 from asyncio import TimeoutError as AsyncTimeOutError
 from collections import deque
@@ -9,6 +10,7 @@ from typing import Any
 
 import fastapi
 import httpx
+import orjson
 from typing_extensions import Literal
 
 from gradio.data_classes import (
@@ -21,8 +23,37 @@ from gradio.data_classes import (
 from gradio.helpers import TrackedIterable
 from gradio.utils import AsyncRequest, run_coro_in_background, set_task_name
 
+log = logging.getLogger(__name__)
+
+
+def _encode_json(data: dict) -> str:
+    # orjson is substantially faster than the stdlib encoder that
+    # websocket.send_json would use under the hood
+    return orjson.dumps(
+        data,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME,
+        default=str,
+    ).decode("utf-8")
+
 
 class Event:
+    # The server can hold thousands of queued events at a time; slots avoid
+    # the per-instance __dict__ and roughly halve the memory per event.
+    __slots__ = (
+        "websocket",
+        "session_hash",
+        "fn_index",
+        "_id",
+        "data",
+        "lost_connection_time",
+        "token",
+        "progress",
+        "progress_pending",
+        "log_messages",
+        "out_queue",
+        "send_task",
+    )
+
     def __init__(
         self,
         websocket: fastapi.WebSocket,
@@ -39,8 +70,14 @@ class Event:
         self.progress: Progress | None = None
         self.progress_pending: bool = False
         self.log_messages: deque[LogMessage] = deque()
+        # Out-queue consumed by a per-client sender task; created lazily on
+        # the first queued message (see Queue.queue_message)
+        self.out_queue: asyncio.Queue | None = None
+        self.send_task: asyncio.Task | None = None
 
     async def disconnect(self, code: int = 1000):
+        if self.send_task is not None and not self.send_task.done():
+            self.send_task.cancel()
         await self.websocket.close(code=code)
 
 
@@ -59,25 +96,44 @@ class Queue:
         self.max_thread_count = concurrency_count
         self.update_intervals = update_intervals
         self.active_jobs: list[None | list[Event]] = [None] * concurrency_count
+        # O(1) slot bookkeeping so dispatch does not scan active_jobs
+        self._free_slots = set(range(concurrency_count))
+        self._job_slots: dict[int, int] = {}
         self.delete_lock = asyncio.Lock()
+        # Set whenever an event is pushed or a job slot frees up, so that
+        # start_processing can wait for work instead of polling on a timer.
+        self.wakeup_event = asyncio.Event()
         self.server_path = None
+        self.duration_history_size = 100
+        self.duration_history: deque[float] = deque(maxlen=self.duration_history_size)
         self.duration_history_total = 0
-        self.duration_history_count = 0
         self.avg_process_time = 0
         self.avg_concurrent_process_time = None
         self.queue_duration = 1
+        # Serialized estimation shared by broadcasts, rebuilt only after the
+        # queue length or the timing stats change
+        self._estimation_message: dict | None = None
         self.live_updates = live_updates
-        self.sleep_when_free = 0.05
         self.progress_update_sleep_when_free = 0.1
         self.max_size = max_size
         self.blocks_dependencies = blocks_dependencies
         self.access_token = ""
         self.queue_client = None
         self.continuous_tasks: list[Event] = []
+        self._broadcast_task: asyncio.Task | None = None
 
     async def start(self, ssl_verify=True):
         # So that the client is attached to the running event loop
-        self.queue_client = httpx.AsyncClient(verify=ssl_verify)
+        self.queue_client = httpx.AsyncClient(
+            verify=ssl_verify,
+            # Keep enough connections alive to cover concurrent predictions
+            # plus their iterator resets, so events do not pay a TCP (and
+            # possibly SSL) handshake per request.
+            limits=httpx.Limits(
+                max_keepalive_connections=self.max_thread_count * 2,
+                max_connections=None,
+            ),
+        )
 
         run_coro_in_background(self.start_processing)
         run_coro_in_background(self.start_log_and_progress_updates)
@@ -86,6 +142,8 @@ class Queue:
 
     def close(self):
         self.stopped = True
+        # Wake up start_processing so it can observe the stopped flag
+        self.wakeup_event.set()
 
     def resume(self):
         self.stopped = False
@@ -108,6 +166,7 @@ class Queue:
             return None, False
 
         first_event = self.event_queue.popleft()
+        self._estimation_message = None
         events = [first_event]
 
         event_fn_index = first_event.fn_index
@@ -118,29 +177,57 @@ class Queue:
             rest_of_batch = [
                 event for event in self.event_queue if event.fn_index == event_fn_index
             ][: batch_size - 1]
-            events.extend(rest_of_batch)
-            [self.event_queue.remove(event) for event in rest_of_batch]
+            if rest_of_batch:
+                events.extend(rest_of_batch)
+                # Rebuild the queue in a single pass rather than calling
+                # remove() (an O(n) scan) once per batched event.
+                taken = set(rest_of_batch)
+                remaining = [event for event in self.event_queue if event not in taken]
+                self.event_queue.clear()
+                self.event_queue.extend(remaining)
 
         return events, batch
 
     async def start_processing(self) -> None:
+        # These containers are mutated in place and never rebound, so bind
+        # them to locals once instead of re-dereferencing per iteration.
+        event_queue = self.event_queue
+        free_slots = self._free_slots
+        active_jobs = self.active_jobs
+        job_slots = self._job_slots
+        wakeup_event = self.wakeup_event
+        delete_lock = self.delete_lock
         while not self.stopped:
-            if not self.event_queue:
-                await asyncio.sleep(self.sleep_when_free)
-                continue
-
-            if None not in self.active_jobs:
-                await asyncio.sleep(self.sleep_when_free)
+            if not event_queue or not free_slots:
+                # Nothing to dispatch: wait until an event is pushed or a
+                # job slot frees up, rather than polling on a timer. The
+                # flag is cleared before re-checking the condition so that
+                # a set() racing with the check is not lost.
+                wakeup_event.clear()
+                if self.stopped or (event_queue and free_slots):
+                    continue
+                await wakeup_event.wait()
                 continue
             # Using mutex to avoid editing a list in use
-            async with self.delete_lock:
+            async with delete_lock:
                 events, batch = self.get_events_in_batch()
 
             if events:
-                self.active_jobs[self.active_jobs.index(None)] = events
+                slot = free_slots.pop()
+                active_jobs[slot] = events
+                job_slots[id(events)] = slot
                 task = run_coro_in_background(self.process_events, events, batch)
-                run_coro_in_background(self.broadcast_live_estimations)
+                # Debounce: back-to-back dispatches share one broadcast task
+                # instead of creating a new one per event.
+                if self._broadcast_task is None or self._broadcast_task.done():
+                    self._broadcast_task = run_coro_in_background(
+                        self.broadcast_live_estimations
+                    )
                 set_task_name(task, events[0].session_hash, events[0].fn_index, batch)
+                # asyncio.sleep(0) takes the loop's fast yield path (no timer
+                # handle), letting the tasks created above start before the
+                # next event is dispatched.
+                await asyncio.sleep(0)
 
     async def start_log_and_progress_updates(self) -> None:
         while not self.stopped:
@@ -226,12 +313,21 @@ class Queue:
         if self.max_size is not None and queue_len >= self.max_size:
             return None
         self.event_queue.append(event)
+        self._estimation_message = None
+        self.wakeup_event.set()
         return queue_len
 
     async def clean_event(self, event: Event) -> None:
-        if event in self.event_queue:
-            async with self.delete_lock:
+        # Remove in a single scan instead of a membership check followed by
+        # remove(), which traverses the queue twice.
+        async with self.delete_lock:
+            try:
                 self.event_queue.remove(event)
+                self._estimation_message = None
+            except ValueError:
+                pass
+        if event.send_task is not None and not event.send_task.done():
+            event.send_task.cancel()
 
     async def broadcast_live_estimations(self) -> None:
         """
@@ -277,14 +373,56 @@ class Queue:
                 await self.broadcast_estimations()
 
     async def broadcast_estimations(self) -> None:
-        estimation = self.get_estimation()
-        # Send all messages concurrently
-        await asyncio.gather(
-            *[
-                self.send_estimation(event, estimation, rank)
-                for rank, event in enumerate(self.event_queue)
-            ]
-        )
+        # Serialize the shared fields of the estimation once; only the
+        # rank-dependent fields differ between clients.
+        if self._estimation_message is None:
+            self._estimation_message = self.get_estimation().dict()
+        base_message = self._estimation_message
+        # Fan out without awaiting each send: messages go to per-client
+        # out-queues consumed by sender tasks, so one slow client cannot
+        # stall the broadcast for everyone else. Bind the per-client calls
+        # to locals to keep attribute lookups out of the loop.
+        get_rank_eta = self.get_rank_eta
+        queue_message = self.queue_message
+        for rank, event in enumerate(self.event_queue):
+            message = dict(base_message)
+            message["rank"] = rank
+            message["rank_eta"] = get_rank_eta(rank)
+            queue_message(event, message)
+
+    def queue_message(self, event: Event, data: dict) -> None:
+        """
+        Queue a message to be sent to a client by its sender task, without
+        blocking on the client's connection.
+        """
+        if event.out_queue is None:
+            event.out_queue = asyncio.Queue(maxsize=32)
+            event.send_task = run_coro_in_background(self.send_from_queue, event)
+        if event.out_queue.full():
+            # Drop the oldest pending message so that slow clients receive
+            # the freshest estimations instead of a growing backlog.
+            try:
+                event.out_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+        event.out_queue.put_nowait(data)
+
+    async def send_from_queue(self, event: Event) -> None:
+        assert event.out_queue is not None
+        while True:
+            data = await event.out_queue.get()
+            client_awake = await self.send_message(event, data)
+            if not client_awake:
+                break
+
+    def get_rank_eta(self, rank: int) -> float | None:
+        if self.avg_concurrent_process_time is None:
+            return None
+        rank_eta = rank * self.avg_concurrent_process_time + self.avg_process_time
+        if None not in self.active_jobs:
+            # Add estimated amount of time for a thread to get empty
+            rank_eta += self.avg_concurrent_process_time
+        return rank_eta
 
     async def send_estimation(
         self, event: Event, estimation: Estimation, rank: int
@@ -300,13 +438,7 @@ class Queue:
         estimation.rank = rank
 
         if self.avg_concurrent_process_time is not None:
-            estimation.rank_eta = (
-                estimation.rank * self.avg_concurrent_process_time
-                + self.avg_process_time
-            )
-            if None not in self.active_jobs:
-                # Add estimated amount of time for a thread to get empty
-                estimation.rank_eta += self.avg_concurrent_process_time
+            estimation.rank_eta = self.get_rank_eta(rank)
         client_awake = await self.send_message(event, estimation.dict())
         if not client_awake:
             await self.clean_event(event)
@@ -319,15 +451,18 @@ class Queue:
         Parameters:
             duration:
         """
+        # Keep a running sum over the window so the rolling mean is O(1)
+        # per completed event.
+        if len(self.duration_history) == self.duration_history.maxlen:
+            self.duration_history_total -= self.duration_history[0]
+        self.duration_history.append(duration)
         self.duration_history_total += duration
-        self.duration_history_count += 1
-        self.avg_process_time = (
-            self.duration_history_total / self.duration_history_count
-        )
+        self.avg_process_time = self.duration_history_total / len(self.duration_history)
         self.avg_concurrent_process_time = self.avg_process_time / min(
-            self.max_thread_count, self.duration_history_count
+            self.max_thread_count, len(self.duration_history)
         )
         self.queue_duration = self.avg_concurrent_process_time * len(self.event_queue)
+        self._estimation_message = None
 
     def get_estimation(self) -> Estimation:
         return Estimation(
@@ -385,7 +520,10 @@ class Queue:
         awake_events: list[Event] = []
         try:
             for event in events:
-                client_awake = await self.gather_event_data(event)
+                # Skip the no-op coroutine when data has already been gathered
+                client_awake = True
+                if not event.data:
+                    client_awake = await self.gather_event_data(event)
                 if client_awake:
                     client_awake = await self.send_message(
                         event, {"msg": "process_starts"}
@@ -460,15 +598,22 @@ class Queue:
             end_time = time.time()
             if response.status == 200:
                 self.update_estimation(end_time - begin_time)
-        except Exception as e:
-            print(e)
+        except Exception:
+            log.exception("Unexpected error while processing events")
         finally:
             for event in awake_events:
                 try:
                     await event.disconnect()
                 except Exception:
                     pass
-            self.active_jobs[self.active_jobs.index(events)] = None
+            slot = self._job_slots.pop(id(events), None)
+            if slot is None or self.active_jobs[slot] is not events:
+                # Jobs scheduled outside start_processing (e.g. in tests)
+                # are not in the slot map; fall back to a scan.
+                slot = self.active_jobs.index(events)
+            self.active_jobs[slot] = None
+            self._free_slots.add(slot)
+            self.wakeup_event.set()
             for event in events:
                 await self.clean_event(event)
                 # Always reset the state of the iterator
@@ -480,7 +625,7 @@ class Queue:
     async def send_message(self, event, data: dict, timeout: float | int = 1) -> bool:
         try:
             await asyncio.wait_for(
-                event.websocket.send_json(data=data), timeout=timeout
+                event.websocket.send_text(_encode_json(data)), timeout=timeout
             )
             return True
         except Exception:
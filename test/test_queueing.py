@@ -70,7 +70,45 @@ class TestQueueMethods:
     @pytest.mark.asyncio
     async def test_send(self, queue: Queue, mock_event: Event):
         await queue.send_message(mock_event, {})
-        assert mock_event.websocket.send_json.called
+        assert mock_event.websocket.send_text.called
+
+    @pytest.mark.asyncio
+    async def test_queue_message_creates_sender_task(
+        self, queue: Queue, mock_event: Event
+    ):
+        assert mock_event.out_queue is None
+        assert mock_event.send_task is None
+        queue.queue_message(mock_event, {"msg": "estimation"})
+        assert mock_event.out_queue is not None
+        assert mock_event.send_task is not None
+        await asyncio.sleep(0.1)
+        assert mock_event.websocket.send_text.called
+        mock_event.send_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_queue_message_drops_oldest_when_full(
+        self, queue: Queue, mock_event: Event
+    ):
+        # The sender task never runs (no awaits between puts), so the
+        # out-queue fills to its maxsize and then drops the oldest message
+        for rank in range(33):
+            queue.queue_message(mock_event, {"msg": "estimation", "rank": rank})
+        assert mock_event.out_queue is not None
+        assert mock_event.out_queue.qsize() == 32
+        assert mock_event.out_queue.get_nowait()["rank"] == 1
+        mock_event.send_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_send_from_queue_cleans_dead_client(
+        self, queue: Queue, mock_event: Event
+    ):
+        mock_event.websocket.send_text = AsyncMock(
+            side_effect=ValueError("Can't connect")
+        )
+        queue.push(mock_event)
+        queue.queue_message(mock_event, {"msg": "estimation"})
+        await asyncio.sleep(0.1)
+        assert mock_event not in queue.event_queue
 
     @pytest.mark.asyncio
     async def test_add_to_queue(self, queue: Queue, mock_event: Event):
@@ -140,6 +178,17 @@ class TestQueueEstimation:
         estimation = queue.get_estimation()
         assert estimation.avg_event_process_time == 40  # (5 + 15 + 100) / 3
 
+    def test_estimation_only_reflects_recent_durations(self, queue: Queue):
+        queue.duration_history = deque(maxlen=2)
+        queue.update_estimation(10)
+        queue.update_estimation(20)
+        assert queue.avg_process_time == 15  # (10 + 20) / 2
+
+        # The oldest duration is evicted from the rolling window and no
+        # longer influences the average
+        queue.update_estimation(30)
+        assert queue.avg_process_time == 25  # (20 + 30) / 2
+
     @pytest.mark.asyncio
     async def test_send_estimation(self, queue: Queue, mock_event: Event):
         queue.send_message = AsyncMock()
@@ -178,14 +227,13 @@ class TestQueueProcessEvents:
         queue.call_prediction.return_value = MagicMock()
         queue.call_prediction.return_value.has_exception = False
         queue.call_prediction.return_value.json = {"is_generating": False}
-        mock_event.disconnect = AsyncMock()
         queue.clean_event = AsyncMock()
 
         queue.active_jobs = [[mock_event]]
         await queue.process_events([mock_event], batch=False)
 
         queue.call_prediction.assert_called_once()
-        mock_event.disconnect.assert_called_once()
+        mock_event.websocket.close.assert_called_once()
         queue.clean_event.assert_called_once()
         mock_request.assert_called_with(
             method=AsyncRequest.Method.POST,
@@ -201,10 +249,9 @@ class TestQueueProcessEvents:
     async def test_process_event_handles_error_when_gathering_data(
         self, queue: Queue, mock_event: Event
     ):
-        mock_event.websocket.send_json = AsyncMock()
-        mock_event.websocket.send_json.side_effect = ValueError("Can't connect")
+        mock_event.websocket.send_text = AsyncMock()
+        mock_event.websocket.send_text.side_effect = ValueError("Can't connect")
         queue.call_prediction = AsyncMock()
-        mock_event.disconnect = AsyncMock()
         queue.clean_event = AsyncMock()
         mock_event.data = None
 
@@ -218,12 +265,11 @@ class TestQueueProcessEvents:
     async def test_process_event_handles_error_sending_process_start_msg(
         self, queue: Queue, mock_event: Event
     ):
-        mock_event.websocket.send_json = AsyncMock()
+        mock_event.websocket.send_text = AsyncMock()
         mock_event.websocket.receive_json.return_value = {"data": ["test"], "fn": 0}
 
-        mock_event.websocket.send_json.side_effect = ["2", ValueError("Can't connect")]
+        mock_event.websocket.send_text.side_effect = ["2", ValueError("Can't connect")]
         queue.call_prediction = AsyncMock()
-        mock_event.disconnect = AsyncMock()
         queue.clean_event = AsyncMock()
         mock_event.data = None
 
@@ -237,7 +283,6 @@ class TestQueueProcessEvents:
     async def test_process_event_handles_exception_in_call_prediction_request(
         self, queue: Queue, mock_event: Event
     ):
-        mock_event.disconnect = AsyncMock()
         queue.gather_event_data = AsyncMock(return_value=True)
         queue.clean_event = AsyncMock()
         queue.send_message = AsyncMock(return_value=True)
@@ -249,7 +294,7 @@ class TestQueueProcessEvents:
         await queue.process_events([mock_event], batch=False)
 
         queue.call_prediction.assert_called_once()
-        mock_event.disconnect.assert_called_once()
+        mock_event.websocket.close.assert_called_once()
         assert queue.clean_event.call_count >= 1
 
     @pytest.mark.asyncio
@@ -263,7 +308,6 @@ class TestQueueProcessEvents:
             MagicMock(has_exception=False, status=200, json={"is_generating": True}),
             MagicMock(has_exception=False, status=500, json={"error": "Foo"}),
         ]
-        mock_event.disconnect = AsyncMock()
         queue.gather_event_data = AsyncMock(return_value=True)
         queue.clean_event = AsyncMock()
         queue.send_message = AsyncMock(return_value=True)
@@ -281,7 +325,7 @@ class TestQueueProcessEvents:
         )
 
         assert queue.call_prediction.call_count == 2
-        mock_event.disconnect.assert_called_once()
+        mock_event.websocket.close.assert_called_once()
         assert queue.clean_event.call_count >= 1
 
     @pytest.mark.asyncio
@@ -289,8 +333,8 @@ class TestQueueProcessEvents:
         self, queue: Queue, mock_event: Event
     ):
         mock_event.websocket.receive_json.return_value = {"data": ["test"], "fn": 0}
-        mock_event.websocket.send_json = AsyncMock()
-        mock_event.websocket.send_json.side_effect = [
+        mock_event.websocket.send_text = AsyncMock()
+        mock_event.websocket.send_text.side_effect = [
             "2",
             "3",
             ValueError("Can't connect"),
@@ -298,7 +342,6 @@ class TestQueueProcessEvents:
         queue.call_prediction = AsyncMock(
             return_value=MagicMock(has_exception=False, json={"is_generating": False})
         )
-        mock_event.disconnect = AsyncMock()
         queue.clean_event = AsyncMock()
         mock_event.data = None
 
@@ -306,7 +349,7 @@ class TestQueueProcessEvents:
         await queue.process_events([mock_event], batch=False)
 
         queue.call_prediction.assert_called_once()
-        mock_event.disconnect.assert_called_once()
+        mock_event.websocket.close.assert_called_once()
         assert queue.clean_event.call_count >= 1
 
     @pytest.mark.asyncio
@@ -315,12 +358,12 @@ class TestQueueProcessEvents:
         self, mock_request, queue: Queue, mock_event: Event
     ):
         mock_event.websocket.receive_json.return_value = {"data": ["test"], "fn": 0}
-        mock_event.websocket.send_json = AsyncMock()
+        mock_event.websocket.send_text = AsyncMock()
         queue.call_prediction = AsyncMock(
             return_value=MagicMock(has_exception=False, json={"is_generating": False})
         )
         # No exception should be raised during `process_event`
-        mock_event.disconnect = AsyncMock(side_effect=ValueError("..."))
+        mock_event.websocket.close = AsyncMock(side_effect=ValueError("..."))
         queue.clean_event = AsyncMock()
         mock_event.data = None
         queue.active_jobs = [[mock_event]]
@@ -350,20 +393,18 @@ class TestQueueBatch:
             "is_generating": False,
             "data": [[1, 2]],
         }
-        mock_event.disconnect = AsyncMock()
         queue.clean_event = AsyncMock()
 
         websocket = MagicMock()
         mock_event2 = Event(websocket=websocket, session_hash="test", fn_index=0)
-        mock_event2.disconnect = AsyncMock()
         queue.active_jobs = [[mock_event, mock_event2]]
 
         await queue.process_events([mock_event, mock_event2], batch=True)
 
         queue.call_prediction.assert_called_once()  # called once for both events
-        mock_event.disconnect.assert_called_once()
+        mock_event.websocket.close.assert_called_once()
 
-        mock_event2.disconnect.assert_called_once()
+        mock_event2.websocket.close.assert_called_once()
         assert queue.clean_event.call_count == 2
 
 